@@ -0,0 +1,73 @@
+"""
+Shared helpers for the scripts that edit the Claude Code config (~/.claude.json).
+"""
+
+import functools
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+CONFIG_PATH = Path.home() / ".claude.json"
+
+EMBED_PATH = Path("C:/code/embed/target/release/embed-search-mcp.exe")
+
+
+@functools.lru_cache(maxsize=1)
+def embed_command():
+    """Return the escaped embed-search command; raise FileNotFoundError if missing."""
+    if not EMBED_PATH.is_file():
+        raise FileNotFoundError(str(EMBED_PATH))
+    return str(EMBED_PATH).replace("\\", "\\\\")
+
+
+def load_config(config_path):
+    """Load the config with a single read into a buffer sized from fstat."""
+    with open(config_path, 'rb', buffering=0) as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        view = memoryview(data)
+        filled = 0
+        while filled < len(data):
+            n = f.readinto(view[filled:])
+            if not n:
+                # file shrank after the fstat
+                data = data[:filled]
+                break
+            filled += n
+    return json.loads(data)
+
+
+def backup_config(config_path, suffix):
+    """Copy the config next to itself and return the backup path."""
+    backup_path = config_path.with_suffix(suffix)
+    # copyfile uses sendfile/copy_file_range where available, so the bytes
+    # never pass through Python
+    shutil.copyfile(config_path, backup_path)
+    return backup_path
+
+
+def write_config(config_path, config):
+    """Atomically replace the config; a failed write leaves the original intact."""
+    data = json.dumps(config, indent=2).encode('utf-8')
+    # Replace the file a symlinked config points at, not the link itself
+    target = Path(os.path.realpath(config_path))
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix='.tmp')
+    try:
+        f = os.fdopen(fd, 'wb')
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    try:
+        with f:
+            f.write(data)
+            # the data must be on disk before the rename, or a crash can
+            # leave an empty or partial config behind the new name
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -5,66 +5,74 @@ The issue: embed-search was added outside the mcpServers object.
 """
 
 import json
-from pathlib import Path
 import sys
 
+from _mcp_common import (
+    CONFIG_PATH, EMBED_PATH, backup_config, embed_command, load_config, write_config
+)
+
 def fix_embed_search_config():
     """Fix embed-search placement in Claude Code configuration."""
     
-    config_path = Path.home() / ".claude.json"
+    config_path = CONFIG_PATH
     
-    if not config_path.exists():
+    # Load existing config; a missing file surfaces from the open itself
+    # rather than from a separate exists() stat
+    try:
+        config = load_config(config_path)
+    except FileNotFoundError:
         print(f"Error: Claude Code config not found at: {config_path}")
         return False
-    
-    print(f"Found Claude Code config at: {config_path}")
-    
-    # Load existing config
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON: {e}")
         return False
     
+    print(f"Found Claude Code config at: {config_path}")
+    
+    changed = False
+    
     # Remove embed-search from root level if it exists
     if "embed-search" in config:
         del config["embed-search"]
+        changed = True
         print("Removed embed-search from root level")
     
     # Ensure mcpServers exists
     if "mcpServers" not in config:
         config["mcpServers"] = {}
+        changed = True
         print("Created mcpServers object")
     
     # Add embed-search to mcpServers if not already there
     if "embed-search" not in config["mcpServers"]:
-        embed_path = Path("C:/code/embed/target/release/embed-search-mcp.exe")
-        
-        if not embed_path.exists():
-            print(f"Error: MCP executable not found at: {embed_path}")
+        try:
+            command = embed_command()
+        except FileNotFoundError:
+            print(f"Error: MCP executable not found at: {EMBED_PATH}")
             return False
         
         config["mcpServers"]["embed-search"] = {
             "type": "stdio",
-            "command": str(embed_path).replace("/", "\\\\").replace("\\", "\\\\"),
+            "command": command,
             "args": []
         }
+        changed = True
         print("Added embed-search to mcpServers object")
     else:
         print("embed-search already in mcpServers")
     
+    # Nothing moved or added: skip the backup and the full rewrite
+    if not changed:
+        print("Configuration already correct, leaving config untouched")
+        return True
+    
     # Backup original config
-    backup_path = config_path.with_suffix('.json.backup2')
-    with open(config_path, 'r', encoding='utf-8') as orig:
-        with open(backup_path, 'w', encoding='utf-8') as backup:
-            backup.write(orig.read())
+    backup_path = backup_config(config_path, '.json.backup2')
     print(f"Backed up original config to: {backup_path}")
     
     # Write updated config
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        write_config(config_path, config)
         print("Successfully fixed embed-search configuration")
         print("\nConfiguration now in mcpServers:")
         print(json.dumps(config["mcpServers"].get("embed-search", {}), indent=2))
@@ -73,11 +81,7 @@ def fix_embed_search_config():
         return True
     except Exception as e:
         print(f"Error writing config: {e}")
-        # Restore backup
-        with open(backup_path, 'r', encoding='utf-8') as backup:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(backup.read())
-        print("Restored original config from backup")
+        print("Original config left unchanged")
         return False
 
 if __name__ == "__main__":